@@ -15,6 +15,14 @@ from typing import Dict, List, Optional, Any, Callable, Tuple
 from contextlib import contextmanager
 
 
+# Indexes added to schema.sql after its first release. schema.sql only runs for a
+# new database, so these are also applied (idempotently) to existing ones.
+_LATER_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_tasks_milestone_status ON tasks(milestone_id, status)",
+    "CREATE INDEX IF NOT EXISTS idx_validations_status ON milestone_validations(validation_status)",
+)
+
+
 class DatabaseManager:
     """Manages SQLite database for IRIS project state"""
 
@@ -49,6 +57,8 @@ class DatabaseManager:
         # Initialize database if it doesn't exist
         if not self.db_path.exists():
             self.initialize_database()
+        else:
+            self._ensure_indexes()
     
     def _find_project_root(self) -> Path:
         """Find project root by looking for .claude directory (IRIS installation marker)"""
@@ -104,15 +114,35 @@ class DatabaseManager:
             print(f"❌ Failed to initialize database: {e}")
             return False
     
-    @contextmanager
-    def get_connection(self):
-        """Get database connection with automatic cleanup"""
+    def _ensure_indexes(self) -> None:
+        """Create indexes that an older database may be missing"""
+        try:
+            with self.get_connection() as conn:
+                for statement in _LATER_INDEXES:
+                    conn.execute(statement)
+                conn.commit()
+        except sqlite3.Error:
+            # Busy, read-only or pre-2.0 database; queries still work without them
+            pass
+
+    def connect(self) -> sqlite3.Connection:
+        """Open a configured connection; the caller is responsible for closing it"""
         conn = sqlite3.connect(str(self.db_path))
         try:
             # Enable row factory for dict-like access
             conn.row_factory = sqlite3.Row
             # Enable foreign keys
             conn.execute("PRAGMA foreign_keys = ON")
+        except Exception:
+            conn.close()
+            raise
+        return conn
+
+    @contextmanager
+    def get_connection(self):
+        """Get database connection with automatic cleanup"""
+        conn = self.connect()
+        try:
             yield conn
         finally:
             conn.close()
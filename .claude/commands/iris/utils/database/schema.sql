@@ -204,7 +204,6 @@ CREATE TABLE IF NOT EXISTS milestone_validations (
 );
 
 -- Performance indexes
-CREATE INDEX IF NOT EXISTS idx_tasks_milestone ON tasks(milestone_id);
 CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status);
 CREATE INDEX IF NOT EXISTS idx_task_deps_task ON task_dependencies(task_id);
 CREATE INDEX IF NOT EXISTS idx_task_deps_depends ON task_dependencies(depends_on_task_id);
@@ -212,6 +211,11 @@ CREATE INDEX IF NOT EXISTS idx_executions_task ON task_executions(task_id);
 CREATE INDEX IF NOT EXISTS idx_validations_milestone ON milestone_validations(milestone_id);
 CREATE INDEX IF NOT EXISTS idx_project_state_key ON project_state(key);
 
+-- Covering indexes for the document generator's status and KPI rollups
+-- (tasks(milestone_id, status) also serves plain milestone_id lookups)
+CREATE INDEX IF NOT EXISTS idx_tasks_milestone_status ON tasks(milestone_id, status);
+CREATE INDEX IF NOT EXISTS idx_validations_status ON milestone_validations(validation_status);
+
 -- Research-related indexes
 CREATE INDEX IF NOT EXISTS idx_research_opp_status ON research_opportunities(status);
 CREATE INDEX IF NOT EXISTS idx_research_opp_category ON research_opportunities(category);
@@ -12,9 +12,14 @@ Modes:
 """
 
 import os
+import re
 import sys
 import json
 import argparse
+import hashlib
+import io
+import sqlite3
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
@@ -26,7 +31,123 @@ sys.path.insert(0, str(Path(__file__).parent))
 from database.db_manager import DatabaseManager
 
 
-@dataclass
+# Status queries, defined once so every render on the generator's long-lived
+# connection hits sqlite3's per-connection prepared statement cache
+_Q_MILESTONE_PROGRESS = """
+    SELECT
+        m.id,
+        COALESCE(m.name, '') as name,
+        COALESCE(m.description, '') as description,
+        COALESCE(NULLIF(m.status, ''), 'pending') as status,
+        -- t.milestone_id is NOT NULL, so counting it keeps the join on the covering index
+        COUNT(t.milestone_id) as tasks_total,
+        COUNT(CASE WHEN t.status = 'completed' THEN 1 END) as tasks_completed,
+        COUNT(CASE WHEN t.status = 'in_progress' THEN 1 END) as tasks_in_progress,
+        COUNT(CASE WHEN t.status = 'pending' THEN 1 END) as tasks_pending,
+        COALESCE(100.0 * COUNT(CASE WHEN t.status = 'completed' THEN 1 END)
+                 / NULLIF(COUNT(t.milestone_id), 0), 0.0) as progress_pct
+    FROM milestones m
+    LEFT JOIN tasks t ON m.id = t.milestone_id
+    GROUP BY m.id
+    ORDER BY m.order_index
+"""
+
+# Current task and next eligible tasks in one statement, tagged by kind.
+# Unmet dependencies are aggregated once per task and anti-joined, rather than
+# re-running a correlated NOT EXISTS subquery for every pending task. The outer
+# ORDER BY fixes the row order; a compound SELECT without one has none.
+_Q_CURRENT_AND_NEXT_TASKS = """
+    WITH dep_status AS (
+        SELECT td.task_id,
+               MAX(CASE WHEN dep.status != 'completed' THEN 1 ELSE 0 END) as has_unmet
+        FROM task_dependencies td
+        JOIN tasks dep ON td.depends_on_task_id = dep.id
+        GROUP BY td.task_id
+    )
+    SELECT * FROM (
+        SELECT 'current' as kind, t.id, t.title, m.name as milestone_name, t.started_at,
+               m.order_index as m_order, t.order_index as t_order
+        FROM tasks t
+        JOIN milestones m ON t.milestone_id = m.id
+        WHERE t.status = 'in_progress'
+        LIMIT 1
+    )
+    UNION ALL
+    SELECT * FROM (
+        SELECT 'next' as kind, t.id, t.title, m.name as milestone_name, NULL as started_at,
+               m.order_index as m_order, t.order_index as t_order
+        FROM tasks t
+        JOIN milestones m ON t.milestone_id = m.id
+        LEFT JOIN dep_status d ON d.task_id = t.id
+        WHERE t.status = 'pending'
+        AND COALESCE(d.has_unmet, 0) = 0
+        ORDER BY m.order_index, t.order_index
+        LIMIT 3
+    )
+    ORDER BY kind, m_order, t_order
+"""
+
+# fromisoformat() accepts a trailing 'Z' from Python 3.11 on
+_FAST_ISO = sys.version_info >= (3, 11)
+
+
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO-8601 timestamp, including the 'Z' UTC suffix"""
+    if _FAST_ISO:
+        return datetime.fromisoformat(value)
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+# Slotted dataclasses (Python 3.10+) drop the per-instance __dict__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Milestone checkbox per status, shared across renders
+_STATUS_ICONS = {
+    'completed': '[x]',
+    'validated': '[x]',
+    'in_progress': '[-]',
+    'pending': '[ ]'
+}
+_UNKNOWN_ICON = '[ ]'
+
+# The **Generated:** timestamp changes on every render; it is left out of the
+# digest that decides whether PROJECT_STATUS.md needs rewriting
+_GENERATED_LINE = re.compile(rb'^\*\*Generated:\*\* .*$', re.MULTILINE)
+
+
+def _status_digest(data: bytes) -> bytes:
+    """Digest of rendered status content, ignoring the Generated timestamp"""
+    return hashlib.blake2b(_GENERATED_LINE.sub(b'', data, count=1), digest_size=16).digest()
+
+
+# PROJECT_STATUS.md layout, filled in one str.format() pass; sections are rendered separately
+_STATUS_TEMPLATE = """\
+# Project Status
+
+**Generated:** {generated}
+
+## Overall Progress
+
+| Metric | Value |
+|--------|-------|
+| Total Tasks | {total} |
+| Completed | {completed} |
+| In Progress | {active} |
+| Pending | {pending} |
+| **Progress** | **{progress}%** |
+
+## Milestones
+
+{milestones}
+## Current Activity
+
+{current_activity}
+{next_up}---
+*Updated by IRIS Document Engine*
+"""
+
+
+@dataclass(**_SLOTS)
 class ProjectKPIs:
     """Key Performance Indicators for project completion"""
     total_time_minutes: float = 0.0
@@ -43,7 +164,7 @@ class ProjectKPIs:
     project_type: str = "unknown"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class MilestoneInfo:
     """Information about a milestone for documentation"""
     id: str
@@ -52,6 +173,9 @@ class MilestoneInfo:
     status: str
     tasks_completed: int
     tasks_total: int
+    tasks_in_progress: int = 0
+    tasks_pending: int = 0
+    progress_pct: float = 0.0
     features: List[str] = field(default_factory=list)
 
 
@@ -64,6 +188,46 @@ class DocumentGenerator:
         self.iris_dir = Path(iris_dir)
         self.has_database = db_manager is not None
 
+        # Long-lived read-only connection, opened on first use (see close())
+        self._conn: Optional[sqlite3.Connection] = None
+
+        # Last rendered PROJECT_STATUS.md as (PRAGMA data_version, content)
+        self._status_cache: Optional[Tuple[int, str]] = None
+        # Digest of the last PROJECT_STATUS.md written by this instance
+        self._status_digest: Optional[bytes] = None
+
+    @contextmanager
+    def _read_connection(self):
+        """Yield the shared read-only connection, opening it on first use"""
+        if self._conn is None:
+            conn = self.db.connect()
+            # Read-heavy tuning: 64 MB page cache, memory-mapped reads, in-memory temp b-trees
+            conn.execute("PRAGMA cache_size = -65536")
+            conn.execute("PRAGMA mmap_size = 268435456")
+            conn.execute("PRAGMA temp_store = MEMORY")
+            # Documentation is generated from reads only; never block writers
+            conn.execute("PRAGMA query_only = ON")
+            self._conn = conn
+        yield self._conn
+
+    @contextmanager
+    def _read_transaction(self):
+        """Yield the read connection inside one transaction (a consistent snapshot)"""
+        with self._read_connection() as conn:
+            conn.execute("BEGIN")
+            try:
+                yield conn
+            finally:
+                conn.execute("COMMIT")
+
+    def close(self) -> None:
+        """Close the shared database connection"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        # data_version is per connection; a reopened one restarts the counter
+        self._status_cache = None
+
     # =========================================================================
     # README.md Generation
     # =========================================================================
@@ -79,7 +243,7 @@ class DocumentGenerator:
     def _generate_readme_from_db(self, mode: str) -> str:
         """Generate README from IRIS database state"""
 
-        with self.db.get_connection() as conn:
+        with self._read_transaction() as conn:
             # Get project metadata
             metadata = self._get_metadata_dict(conn)
 
@@ -95,15 +259,18 @@ class DocumentGenerator:
             project_name = metadata.get('project_name', self.project_root.name)
             project_desc = metadata.get('project_description', 'An IRIS-managed project')
 
-            # Determine which features are complete
+            # Determine which features are complete and total progress in one pass
             completed_features = []
             planned_features = []
+            total_tasks = completed_tasks = 0
 
             for milestone in milestones:
                 if milestone.status in ['completed', 'validated']:
                     completed_features.extend(milestone.features)
                 else:
                     planned_features.extend(milestone.features)
+                total_tasks += milestone.tasks_total
+                completed_tasks += milestone.tasks_completed
 
             # Build tech stack section
             tech_by_category = {}
@@ -117,67 +284,60 @@ class DocumentGenerator:
             install_instructions = self._generate_install_instructions(tech_by_category)
 
             # Calculate progress
-            total_tasks = sum(m.tasks_total for m in milestones)
-            completed_tasks = sum(m.tasks_completed for m in milestones)
             progress_pct = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
 
-            # Build README
-            readme = f"""# {project_name}
-
-{project_desc}
-
-"""
+            # Build README in one in-memory buffer instead of repeated str +=
+            buf = io.StringIO()
+            buf.write(f"# {project_name}\n\n{project_desc}\n\n")
 
             # Status badge (text-based)
             if progress_pct >= 100:
-                readme += "**Status:** Complete\n\n"
+                buf.write("**Status:** Complete\n\n")
             else:
-                readme += f"**Status:** In Development ({progress_pct:.0f}% complete)\n\n"
+                buf.write(f"**Status:** In Development ({progress_pct:.0f}% complete)\n\n")
 
             # Features section
             if completed_features or planned_features:
-                readme += "## Features\n\n"
+                buf.write("## Features\n\n")
 
                 if completed_features:
                     for feature in completed_features:
-                        readme += f"- [x] {feature}\n"
+                        buf.write(f"- [x] {feature}\n")
 
                 if planned_features and mode != "final":
                     for feature in planned_features:
-                        readme += f"- [ ] {feature}\n"
+                        buf.write(f"- [ ] {feature}\n")
 
-                readme += "\n"
+                buf.write("\n")
 
             # Tech Stack
             if tech_by_category:
-                readme += "## Tech Stack\n\n"
+                buf.write("## Tech Stack\n\n")
                 for category, techs in tech_by_category.items():
-                    readme += f"**{category.title()}:** {', '.join(techs)}\n"
-                readme += "\n"
+                    buf.write(f"**{category.title()}:** {', '.join(techs)}\n")
+                buf.write("\n")
 
             # Installation
-            readme += "## Installation\n\n"
-            readme += install_instructions + "\n\n"
-
-            # Usage
-            readme += "## Usage\n\n"
-            readme += "```bash\n"
-            readme += "# Add usage examples here\n"
-            readme += "```\n\n"
-
-            # Development
-            readme += "## Development\n\n"
-            readme += "This project was developed using the IRIS autonomous development framework.\n\n"
-
-            # License placeholder
-            readme += "## License\n\n"
-            readme += "See LICENSE file for details.\n\n"
+            buf.write("## Installation\n\n")
+            buf.write(install_instructions + "\n\n")
+
+            # Usage, development notes, license placeholder
+            buf.write(
+                "## Usage\n\n"
+                "```bash\n"
+                "# Add usage examples here\n"
+                "```\n\n"
+                "## Development\n\n"
+                "This project was developed using the IRIS autonomous development framework.\n\n"
+                "## License\n\n"
+                "See LICENSE file for details.\n\n"
+            )
 
             # Footer
-            readme += "---\n"
-            readme += f"*Documentation generated by IRIS on {datetime.now().strftime('%Y-%m-%d %H:%M')}*\n"
+            buf.write("---\n")
+            buf.write(f"*Documentation generated by IRIS on {datetime.now().strftime('%Y-%m-%d %H:%M')}*\n")
 
-            return readme
+            return buf.getvalue()
 
     def _generate_readme_standalone(self) -> str:
         """Generate README by analyzing existing project structure"""
@@ -230,24 +390,22 @@ See LICENSE file for details.
 
         tech_stack = {}
 
-        # Node.js
-        package_json = self.project_root / "package.json"
-        if package_json.exists():
-            try:
-                with open(package_json) as f:
-                    pkg = json.load(f)
-                    tech_stack['runtime'] = ['Node.js']
-
-                    # Detect frameworks
-                    deps = {**pkg.get('dependencies', {}), **pkg.get('devDependencies', {})}
-                    if 'react' in deps:
-                        tech_stack['framework'] = ['React']
-                    elif 'vue' in deps:
-                        tech_stack['framework'] = ['Vue.js']
-                    elif 'express' in deps:
-                        tech_stack['framework'] = ['Express.js']
-            except:
-                pass
+        # Node.js (open directly; a missing package.json lands in the except)
+        try:
+            with open(self.project_root / "package.json") as f:
+                pkg = json.load(f)
+                tech_stack['runtime'] = ['Node.js']
+
+                # Detect frameworks
+                deps = {**pkg.get('dependencies', {}), **pkg.get('devDependencies', {})}
+                if 'react' in deps:
+                    tech_stack['framework'] = ['React']
+                elif 'vue' in deps:
+                    tech_stack['framework'] = ['Vue.js']
+                elif 'express' in deps:
+                    tech_stack['framework'] = ['Express.js']
+        except:
+            pass
 
         # Python
         if (self.project_root / "requirements.txt").exists() or \
@@ -296,32 +454,24 @@ See LICENSE file for details.
     def _get_milestone_info(self, conn) -> List[MilestoneInfo]:
         """Get milestone information with features"""
 
-        milestones_data = conn.execute("""
-            SELECT
-                m.id, m.name, m.description, m.status,
-                COUNT(t.id) as tasks_total,
-                COUNT(CASE WHEN t.status = 'completed' THEN 1 END) as tasks_completed
-            FROM milestones m
-            LEFT JOIN tasks t ON m.id = t.milestone_id
-            GROUP BY m.id
-            ORDER BY m.order_index
-        """).fetchall()
-
+        # Defaults are applied in SQL so every row arrives fully populated.
+        # Rows are unpacked positionally (column order of _Q_MILESTONE_PROGRESS)
+        # rather than looked up by name.
         milestones = []
-        for row in milestones_data:
-            # Extract features from milestone name/description
-            features = []
-            if row['name']:
-                features.append(row['name'])
-
+        for (milestone_id, name, description, status, tasks_total, tasks_completed,
+             tasks_in_progress, tasks_pending, progress_pct) in conn.execute(_Q_MILESTONE_PROGRESS):
             milestones.append(MilestoneInfo(
-                id=row['id'],
-                name=row['name'] or '',
-                description=row['description'] or '',
-                status=row['status'] or 'pending',
-                tasks_completed=row['tasks_completed'] or 0,
-                tasks_total=row['tasks_total'] or 0,
-                features=features
+                id=milestone_id,
+                name=name,
+                description=description,
+                status=status,
+                tasks_completed=tasks_completed,
+                tasks_total=tasks_total,
+                tasks_in_progress=tasks_in_progress,
+                tasks_pending=tasks_pending,
+                progress_pct=progress_pct,
+                # Features are extracted from the milestone name
+                features=[name] if name else []
             ))
 
         return milestones
@@ -330,118 +480,87 @@ See LICENSE file for details.
     # PROJECT_STATUS.md Generation
     # =========================================================================
 
-    def generate_project_status(self) -> str:
-        """Generate PROJECT_STATUS.md content"""
+    def generate_project_status(self, force: bool = False) -> str:
+        """Generate PROJECT_STATUS.md content
+
+        Reuses the previous render while the database is unchanged,
+        unless force is set.
+        """
 
         if not self.has_database:
             return self._generate_status_standalone()
 
-        with self.db.get_connection() as conn:
-            # Get statistics
-            task_stats = conn.execute("""
-                SELECT
-                    COUNT(*) as total_tasks,
-                    COUNT(CASE WHEN status = 'completed' THEN 1 END) as completed_tasks,
-                    COUNT(CASE WHEN status = 'in_progress' THEN 1 END) as active_tasks,
-                    COUNT(CASE WHEN status = 'pending' THEN 1 END) as pending_tasks
-                FROM tasks
-            """).fetchone()
+        # All status queries share one read transaction: one lock, one snapshot
+        with self._read_transaction() as conn:
+            # data_version changes whenever another connection commits; this one never writes
+            version = conn.execute("PRAGMA data_version").fetchone()[0]
+            if not force and self._status_cache and self._status_cache[0] == version:
+                return self._status_cache[1]
 
-            milestone_stats = conn.execute("""
-                SELECT
-                    COUNT(*) as total_milestones,
-                    COUNT(CASE WHEN status IN ('completed', 'validated') THEN 1 END) as completed_milestones
-                FROM milestones
-            """).fetchone()
-
-            # Get milestones with progress
+            # Get milestones with per-status task counts (also the source of the totals)
             milestones = self._get_milestone_info(conn)
 
-            # Get current task
-            current_task = conn.execute("""
-                SELECT t.id, t.title, t.started_at, m.name as milestone_name
-                FROM tasks t
-                JOIN milestones m ON t.milestone_id = m.id
-                WHERE t.status = 'in_progress'
-                LIMIT 1
-            """).fetchone()
-
-            # Get next eligible tasks
-            next_tasks = conn.execute("""
-                SELECT t.id, t.title, m.name as milestone_name
-                FROM tasks t
-                JOIN milestones m ON t.milestone_id = m.id
-                WHERE t.status = 'pending'
-                AND NOT EXISTS (
-                    SELECT 1 FROM task_dependencies td
-                    JOIN tasks dep ON td.depends_on_task_id = dep.id
-                    WHERE td.task_id = t.id AND dep.status != 'completed'
-                )
-                ORDER BY m.order_index, t.order_index
-                LIMIT 3
-            """).fetchall()
+            # Get current task and next eligible tasks in one round-trip
+            current_task = None
+            next_tasks = []
+            for kind, task_id, title, milestone_name, started_at, _, _ in conn.execute(_Q_CURRENT_AND_NEXT_TASKS):
+                if kind == 'current':
+                    current_task = (task_id, title, milestone_name, started_at)
+                else:
+                    next_tasks.append((task_id, title, milestone_name))
 
             # Calculate progress
-            total = task_stats['total_tasks']
-            completed = task_stats['completed_tasks']
+            total = completed = active = pending = 0
+            for m in milestones:
+                total += m.tasks_total
+                completed += m.tasks_completed
+                active += m.tasks_in_progress
+                pending += m.tasks_pending
             progress_pct = (completed / total * 100) if total > 0 else 0
 
-            # Build status markdown
-            status = f"""# Project Status
-
-**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-## Overall Progress
-
-| Metric | Value |
-|--------|-------|
-| Total Tasks | {total} |
-| Completed | {completed} |
-| In Progress | {task_stats['active_tasks']} |
-| Pending | {task_stats['pending_tasks']} |
-| **Progress** | **{progress_pct:.1f}%** |
-
-## Milestones
-
-"""
-
+            # Build status sections as line lists joined once
+            milestone_lines = []
             for m in milestones:
-                icon = {
-                    'completed': '[x]',
-                    'validated': '[x]',
-                    'in_progress': '[-]',
-                    'pending': '[ ]'
-                }.get(m.status, '[ ]')
+                icon = _STATUS_ICONS.get(m.status, _UNKNOWN_ICON)
 
-                m_progress = (m.tasks_completed / m.tasks_total * 100) if m.tasks_total > 0 else 0
-                status += f"- {icon} **{m.name}** - {m.tasks_completed}/{m.tasks_total} tasks ({m_progress:.0f}%)\n"
-
-            status += "\n"
+                milestone_lines.append(
+                    f"- {icon} **{m.name}** - {m.tasks_completed}/{m.tasks_total} tasks ({m.progress_pct:.0f}%)\n"
+                )
 
             # Current activity
-            status += "## Current Activity\n\n"
             if current_task:
-                status += f"**Working on:** {current_task['id']} - {current_task['title']}\n"
-                status += f"**Milestone:** {current_task['milestone_name']}\n"
-                if current_task['started_at']:
-                    status += f"**Started:** {current_task['started_at']}\n"
+                task_id, title, milestone_name, started_at = current_task
+                activity_lines = [
+                    f"**Working on:** {task_id} - {title}\n",
+                    f"**Milestone:** {milestone_name}\n",
+                ]
+                if started_at:
+                    activity_lines.append(f"**Started:** {started_at}\n")
             else:
-                status += "*No active tasks*\n"
-
-            status += "\n"
+                activity_lines = ["*No active tasks*\n"]
 
             # Next up
+            next_up_lines = []
             if next_tasks:
-                status += "## Next Up\n\n"
-                for i, task in enumerate(next_tasks, 1):
-                    status += f"{i}. **{task['id']}** - {task['title']} *(in {task['milestone_name']})*\n"
-                status += "\n"
-
-            # Footer
-            status += "---\n"
-            status += "*Updated by IRIS Document Engine*\n"
-
-            return status
+                next_up_lines.append("## Next Up\n\n")
+                for i, (task_id, title, milestone_name) in enumerate(next_tasks, 1):
+                    next_up_lines.append(f"{i}. **{task_id}** - {title} *(in {milestone_name})*\n")
+                next_up_lines.append("\n")
+
+            status = _STATUS_TEMPLATE.format(
+                generated=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                total=total,
+                completed=completed,
+                active=active,
+                pending=pending,
+                progress=f"{progress_pct:.1f}",
+                milestones="".join(milestone_lines),
+                current_activity="".join(activity_lines),
+                next_up="".join(next_up_lines),
+            )
+
+        self._status_cache = (version, status)
+        return status
 
     def _generate_status_standalone(self) -> str:
         """Generate basic status for non-IRIS projects"""
@@ -461,15 +580,16 @@ This project is not managed by IRIS. Run `/iris:plan` to create a sprint plan.
     # COMPLETION_REPORT.md Generation & KPIs
     # =========================================================================
 
-    def calculate_kpis(self) -> ProjectKPIs:
-        """Calculate project KPIs from database"""
+    def calculate_kpis(self, now: Optional[datetime] = None) -> ProjectKPIs:
+        """Calculate project KPIs from database (now defaults to the current time)"""
 
         if not self.has_database:
             return ProjectKPIs()
 
         kpis = ProjectKPIs()
+        now = now or datetime.now()
 
-        with self.db.get_connection() as conn:
+        with self._read_transaction() as conn:
             # Get metadata
             metadata = self._get_metadata_dict(conn)
             kpis.project_complexity = metadata.get('project_complexity', 'unknown')
@@ -477,12 +597,12 @@ This project is not managed by IRIS. Run `/iris:plan` to create a sprint plan.
 
             # Calculate total time
             start_time = metadata.get('analysis_timestamp')
-            end_time = metadata.get('autopilot_completed', datetime.now().isoformat())
+            end_time = metadata.get('autopilot_completed', now.isoformat())
 
             if start_time:
                 try:
-                    start = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
-                    end = datetime.fromisoformat(end_time.replace('Z', '+00:00'))
+                    start = _parse_iso(start_time)
+                    end = _parse_iso(end_time)
                     kpis.total_time_minutes = (end - start).total_seconds() / 60
                 except:
                     pass
@@ -500,27 +620,22 @@ This project is not managed by IRIS. Run `/iris:plan` to create a sprint plan.
             kpis.tasks_completed = task_stats['completed'] or 0
             kpis.avg_task_duration_minutes = task_stats['avg_duration'] or 0.0
 
-            # Milestone stats
-            milestone_stats = conn.execute("""
-                SELECT
-                    COUNT(*) as total,
-                    COUNT(CASE WHEN status IN ('completed', 'validated') THEN 1 END) as completed
-                FROM milestones
-            """).fetchone()
+            # Milestone stats (one row per status)
+            milestone_counts = dict(conn.execute(
+                "SELECT status, COUNT(*) FROM milestones GROUP BY status"
+            ).fetchall())
 
-            kpis.milestones_total = milestone_stats['total'] or 0
-            kpis.milestones_completed = milestone_stats['completed'] or 0
+            kpis.milestones_total = sum(milestone_counts.values())
+            kpis.milestones_completed = (milestone_counts.get('completed', 0) +
+                                         milestone_counts.get('validated', 0))
 
-            # Validation stats
-            validation_stats = conn.execute("""
-                SELECT
-                    COUNT(*) as total,
-                    COUNT(CASE WHEN validation_status = 'passed' THEN 1 END) as passed
-                FROM milestone_validations
-            """).fetchone()
+            # Validation stats (one row per status, read from idx_validations_status)
+            validation_counts = dict(conn.execute(
+                "SELECT validation_status, COUNT(*) FROM milestone_validations GROUP BY validation_status"
+            ).fetchall())
 
-            kpis.validations_total = validation_stats['total'] or 0
-            kpis.validations_passed = validation_stats['passed'] or 0
+            kpis.validations_total = sum(validation_counts.values())
+            kpis.validations_passed = validation_counts.get('passed', 0)
 
             # Error recovery count (check task_executions for retries)
             try:
@@ -535,10 +650,10 @@ This project is not managed by IRIS. Run `/iris:plan` to create a sprint plan.
 
         return kpis
 
-    def generate_completion_report(self, kpis: ProjectKPIs) -> str:
+    def generate_completion_report(self, kpis: ProjectKPIs, now: Optional[datetime] = None) -> str:
         """Generate COMPLETION_REPORT.md content"""
 
-        with self.db.get_connection() as conn:
+        with self._read_connection() as conn:
             metadata = self._get_metadata_dict(conn)
             project_name = metadata.get('project_name', self.project_root.name)
 
@@ -549,7 +664,7 @@ This project is not managed by IRIS. Run `/iris:plan` to create a sprint plan.
         report = f"""# IRIS Completion Report
 
 **Project:** {project_name}
-**Completed:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+**Completed:** {(now or datetime.now()).strftime('%Y-%m-%d %H:%M:%S')}
 **Complexity:** {kpis.project_complexity.upper()}
 **Type:** {kpis.project_type}
 
@@ -587,7 +702,7 @@ This project is not managed by IRIS. Run `/iris:plan` to create a sprint plan.
     def format_terminal_report(self, kpis: ProjectKPIs) -> str:
         """Format KPIs for terminal output"""
 
-        with self.db.get_connection() as conn:
+        with self._read_connection() as conn:
             metadata = self._get_metadata_dict(conn)
             project_name = metadata.get('project_name', self.project_root.name)
 
@@ -650,14 +765,27 @@ This project is not managed by IRIS. Run `/iris:plan` to create a sprint plan.
             return False
 
     def update_project_status(self) -> bool:
-        """Write PROJECT_STATUS.md to project root"""
+        """Write PROJECT_STATUS.md to project root (skipped when unchanged)"""
         try:
             content = self.generate_project_status()
             status_path = self.project_root / "PROJECT_STATUS.md"
 
-            with open(status_path, 'w') as f:
-                f.write(content)
-
+            encoded = content.encode('utf-8')
+            digest = _status_digest(encoded)
+            if self._status_digest is None and status_path.exists():
+                # Seed from the file on disk so a fresh process can skip too
+                self._status_digest = _status_digest(status_path.read_bytes())
+            if digest == self._status_digest and status_path.exists():
+                print(f"  PROJECT_STATUS.md unchanged")
+                return True
+
+            # Swap in a complete file so watchers never read a partial write
+            tmp_path = status_path.with_name(status_path.name + ".tmp")
+            with open(tmp_path, 'wb') as f:
+                f.write(encoded)
+            os.replace(tmp_path, status_path)
+
+            self._status_digest = digest
             print(f"  PROJECT_STATUS.md updated")
             return True
         except Exception as e:
@@ -667,8 +795,10 @@ This project is not managed by IRIS. Run `/iris:plan` to create a sprint plan.
     def write_completion_report(self) -> bool:
         """Write COMPLETION_REPORT.md to project root"""
         try:
-            kpis = self.calculate_kpis()
-            content = self.generate_completion_report(kpis)
+            # One clock reading so the report's duration and timestamp agree
+            now = datetime.now()
+            kpis = self.calculate_kpis(now)
+            content = self.generate_completion_report(kpis, now)
             report_path = self.project_root / "COMPLETION_REPORT.md"
 
             with open(report_path, 'w') as f:
@@ -730,6 +860,8 @@ def main():
         generator.update_readme(mode="update")
         generator.update_project_status()
 
+    generator.close()
+
     print("=" * 40)
     print("Documentation update complete")
 
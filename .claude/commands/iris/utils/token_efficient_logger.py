@@ -5,9 +5,14 @@ Minimizes terminal output to reduce token usage while maintaining full file-base
 """
 
 import os
+import sys
 import json
+import argparse
+import atexit
 import time
 import threading
+import weakref
+from collections import Counter, deque
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 from pathlib import Path
@@ -22,19 +27,83 @@ class LogLevel(Enum):
     CRITICAL = 4
     MILESTONE = 5  # Special level for milestone updates
 
+# fdatasync() skips metadata-only flushes; not available on every platform
+_fdatasync = getattr(os, 'fdatasync', os.fsync)
+
+# Most buffers one writev() accepts here; 16 is the POSIX minimum (_XOPEN_IOV_MAX)
+try:
+    _IOV_MAX = os.sysconf('SC_IOV_MAX')
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = -1
+if _IOV_MAX < 1:
+    _IOV_MAX = 16
+
+# Compact encoder for log context, built once; json.dumps() with custom
+# separators constructs a new JSONEncoder on every call
+_CONTEXT_ENCODER = json.JSONEncoder(separators=(',', ':'))
+
+# Padded level names for the file log, built once instead of per entry
+_LEVEL_TAG = {level: level.name.ljust(9) for level in LogLevel}
+
+# Fixed console prefixes; other levels (incl. milestones) are prefixed with [HH:MM]
+_CONSOLE_PREFIX = {
+    LogLevel.CRITICAL: "🚨 CRITICAL: ",
+    LogLevel.ERROR: "❌ ERROR: ",
+    LogLevel.WARNING: "⚠️  WARNING: ",
+}
+
 class OutputMode(Enum):
     """Terminal output modes"""
     SILENT = "silent"          # Minimal terminal output (autopilot)
     VERBOSE = "verbose"        # Full terminal output (debug/learning)
     EMERGENCY = "emergency"    # Only critical errors
 
+class SyncMode(Enum):
+    """Log file durability (fdatasync policy)"""
+    NEVER = "never"            # Rely on the OS page cache (default)
+    INTERVAL = "interval"      # Background writer syncs every sync_interval_sec
+    ALWAYS = "always"          # Sync after every ERROR and above
+
+# Console visibility per mode and level: True/False, or _INTERVAL for
+# time-based batching (shown once the console update interval has passed)
+_INTERVAL = "interval"
+_CONSOLE_RULES = {
+    OutputMode.VERBOSE: {level: True for level in LogLevel},
+    OutputMode.EMERGENCY: {level: level == LogLevel.CRITICAL for level in LogLevel},
+    OutputMode.SILENT: {
+        LogLevel.DEBUG: False,
+        LogLevel.INFO: False,
+        LogLevel.WARNING: _INTERVAL,
+        LogLevel.ERROR: _INTERVAL,
+        LogLevel.CRITICAL: True,   # Only milestones and critical errors
+        LogLevel.MILESTONE: True,
+    },
+}
+
+# Loggers still open at interpreter exit. A WeakSet, so registering for the
+# exit-time close() does not by itself keep a logger (and its file) alive;
+# a silent-mode logger is still held by its writer thread until close()
+_OPEN_LOGGERS = weakref.WeakSet()
+
+def _close_open_loggers():
+    for logger in list(_OPEN_LOGGERS):
+        logger.close()
+
+atexit.register(_close_open_loggers)
+
 class TokenEfficientLogger:
     """
     Logger optimized for long-running autopilot sessions
     """
     
-    def __init__(self, mode: OutputMode = OutputMode.SILENT, project_root: str = None):
+    def __init__(self, mode: OutputMode = OutputMode.SILENT, project_root: str = None,
+                 aggregate_tasks: bool = False, file_min_level: LogLevel = LogLevel.DEBUG,
+                 append_only: bool = False, sync_mode: SyncMode = SyncMode.NEVER,
+                 sync_interval_sec: float = 5.0):
         self.mode = mode
+        self.sync_mode = sync_mode
+        self.sync_interval_sec = sync_interval_sec
+        self._append_only = append_only  # one-shot use: append entries, no session setup
         self.project_root = Path(project_root or os.getcwd())
         self.tasks_dir = self.project_root / ".tasks"
         self.tasks_dir.mkdir(exist_ok=True)
@@ -46,37 +115,61 @@ class TokenEfficientLogger:
         
         # State tracking
         self.session_start = datetime.now()
-        self.last_console_update = datetime.now()
+        self.last_console_update = time.monotonic()  # monotonic seconds, immune to clock changes
         self.console_update_interval = timedelta(minutes=5)  # 5 min between console updates
-        self.milestone_history = []
+        self._file_min_level = file_min_level.value  # entries below this skip the log file
+        self._clock_cache = (0, "")  # (epoch second, "%H:%M:%S"), refreshed once per second
+        self.milestone_history = deque(maxlen=1024)  # most recent milestone updates
         self.error_count = 0
         self.warning_count = 0
+        self._milestones_completed = 0
+        self._metrics_dirty = False  # a counter changed since the metrics file was written
+        self._metrics_minutes = 0    # session minutes in the last metrics write
         
         # Terminal output buffer (for batching)
         self.console_buffer = []
         self.buffer_lock = threading.Lock()
         
+        # Encoded file entries awaiting the writer; deque.append is atomic, so callers never lock
+        self._pending = deque()
+        self._writer_thread = None
+        self._stop = threading.Event()
+        self._unsynced = False  # bytes written since the last fdatasync
+        
+        # Opt-in (silent mode only): task updates are counted and logged as one line per second
+        self._aggregate_tasks = aggregate_tasks and mode == OutputMode.SILENT
+        self._task_counts = Counter()
+        self._task_counts_lock = threading.Lock()
+        
         # Initialize files
         self._initialize_log_files()
         
         # Start background status updater
-        if mode == OutputMode.SILENT:
+        if mode == OutputMode.SILENT and not append_only:
             self._start_status_updater()
     
     def _initialize_log_files(self):
         """Initialize log files with headers"""
-        # Clear/create log file
-        with open(self.log_file, 'w') as f:
-            f.write(f"# IRIS Autopilot Log\n")
-            f.write(f"# Started: {self.session_start.isoformat()}\n")
-            f.write(f"# Mode: {self.mode.value}\n")
-            f.write(f"# Project: {self.project_root}\n")
-            f.write(f"{'='*60}\n\n")
+        # Keep the log open for the session; queued entries are written in batches.
+        # Earlier sessions are kept: the file is appended to, never truncated
+        self._log_fp = open(self.log_file, 'ab', buffering=0)
+        _OPEN_LOGGERS.add(self)
+        
+        # Sessions always mark their start; one-shot appends only head a new file
+        if not self._append_only or os.fstat(self._log_fp.fileno()).st_size == 0:
+            header = (f"# IRIS Autopilot Log\n"
+                      f"# Started: {self.session_start.isoformat()}\n"
+                      f"# Mode: {self.mode.value}\n"
+                      f"# Project: {self.project_root}\n"
+                      f"{'='*60}\n\n")
+            self._log_fp.write(header.encode('utf-8'))
+        
+        # One-shot calls add their counts to the metrics file on close()
+        if self._append_only:
+            return
         
         # Initialize metrics
         self._update_metrics({
-            "session_start": self.session_start.isoformat(),
-            "mode": self.mode.value,
             "total_logs": 0,
             "console_updates": 0,
             "milestones_completed": 0,
@@ -95,14 +188,22 @@ class TokenEfficientLogger:
             context: Additional context data
             force_console: Force console output regardless of mode
         """
-        timestamp = datetime.now()
-        formatted_message = self._format_log_entry(timestamp, level, message, context)
+        # Console output based on mode and level
+        should_show_console = self._should_show_on_console(level, force_console)
         
-        # Always log to file
-        self._write_to_file(formatted_message)
+        # Neither shown nor filed: skip formatting entirely
+        if not should_show_console and level.value < self._file_min_level:
+            self._increment_metrics(level)
+            return
         
-        # Console output based on mode and level
-        should_show_console = self._should_show_on_console(level, force_console, timestamp)
+        context_str = f" | {_CONTEXT_ENCODER.encode(context)}" if context else ""
+        entry = f"[{self._time_str()}] {_LEVEL_TAG[level]} {message}{context_str}\n"
+        
+        # Log to file; warnings and above reach the disk immediately
+        self._write_to_file(entry.encode('utf-8'))
+        if level.value >= LogLevel.WARNING.value:
+            self._drain()
+            self._maybe_fsync(level)
         
         if should_show_console:
             self._write_to_console(level, message, context)
@@ -140,6 +241,11 @@ class TokenEfficientLogger:
     
     def task_update(self, task_id: str, status: str, duration_minutes: int = None):
         """Log task progress"""
+        if self._aggregate_tasks:
+            with self._task_counts_lock:
+                self._task_counts[status] += 1
+            return
+        
         context = {
             "task_id": task_id,
             "status": status,
@@ -174,68 +280,145 @@ class TokenEfficientLogger:
         """Log info message"""
         self.log(message, LogLevel.INFO, context)
     
+    def debug_enabled(self) -> bool:
+        """Check whether debug messages are recorded, so callers can skip building their context"""
+        return (LogLevel.DEBUG.value >= self._file_min_level or
+                _CONSOLE_RULES[self.mode][LogLevel.DEBUG] is True)
+    
     def debug(self, message: str, context: Dict = None):
         """Log debug message (file only in silent mode)"""
         self.log(f"🔧 {message}", LogLevel.DEBUG, context)
     
-    def _format_log_entry(self, timestamp: datetime, level: LogLevel, 
-                          message: str, context: Dict = None) -> str:
-        """Format log entry for file output"""
-        time_str = timestamp.strftime("%H:%M:%S")
-        level_str = level.name.ljust(9)
-        
-        entry = f"[{time_str}] {level_str} {message}"
-        
-        if context:
-            context_str = json.dumps(context, separators=(',', ':'))
-            entry += f" | {context_str}"
-        
-        return entry + "\n"
+    def _time_str(self) -> str:
+        """Wall-clock time as HH:MM:SS, formatted at most once per second"""
+        now = int(time.time())
+        sec, time_str = self._clock_cache
+        if now != sec:
+            time_str = time.strftime("%H:%M:%S", time.localtime(now))
+            self._clock_cache = (now, time_str)
+        return time_str
     
-    def _should_show_on_console(self, level: LogLevel, force_console: bool, 
-                               timestamp: datetime) -> bool:
+    def _should_show_on_console(self, level: LogLevel, force_console: bool) -> bool:
         """Determine if message should appear on console"""
         if force_console:
             return True
         
-        if self.mode == OutputMode.VERBOSE:
-            return True
-        elif self.mode == OutputMode.EMERGENCY:
-            return level == LogLevel.CRITICAL
-        elif self.mode == OutputMode.SILENT:
-            # Only milestones and critical errors
-            if level in [LogLevel.CRITICAL, LogLevel.MILESTONE]:
-                return True
-            
+        rule = _CONSOLE_RULES[self.mode][level]
+        if rule is _INTERVAL:
             # Time-based batching for other messages
-            time_since_last = timestamp - self.last_console_update
-            if time_since_last >= self.console_update_interval:
-                return level in [LogLevel.ERROR, LogLevel.WARNING]
+            time_since_last = time.monotonic() - self.last_console_update
+            return time_since_last >= self.console_update_interval.total_seconds()
+        return rule
+    
+    def _write_to_file(self, entry: bytes):
+        """Queue an encoded entry for the log file"""
+        self._pending.append(entry)
+        if self._writer_thread is None:
+            # No background writer (this mode, after close(), or it stopped); write through
+            self._drain()
+    
+    def _drain(self):
+        """Write all queued entries to the log file (the only writer of the log file)"""
+        with self.buffer_lock:
+            pending = self._pending
+            if pending and self._log_fp.closed:
+                # Logged after close(), e.g. from another atexit hook; append directly
+                entries = [pending.popleft() for _ in range(len(pending))]
+                try:
+                    with open(self.log_file, 'ab') as f:
+                        f.write(b"".join(entries))
+                except OSError:
+                    pending.extendleft(reversed(entries))
+                    raise
+                return
+            while pending:
+                batch = [pending.popleft() for _ in range(min(len(pending), _IOV_MAX))]
+                self._write_batch(batch)
+    
+    def _write_batch(self, batch: List[bytes]):
+        """Write a batch of entries with one writev() where available"""
+        fd = self._log_fp.fileno()
+        self._unsynced = True
+        data = None
+        try:
+            if hasattr(os, 'writev'):
+                written = os.writev(fd, batch)
+                if written == sum(map(len, batch)):
+                    return
+                data = memoryview(b"".join(batch))[written:]
+            else:
+                data = memoryview(b"".join(batch))
+            
+            # Finish a short write
+            while data:
+                data = data[os.write(fd, data):]
+        except OSError:
+            # Requeue whatever was not written, in order, so the next drain retries it
+            if data is None:
+                self._pending.extendleft(reversed(batch))
+            else:
+                self._pending.appendleft(bytes(data))
+            raise
+    
+    def _maybe_fsync(self, level: LogLevel):
+        """Sync the log file after an error when sync_mode is ALWAYS"""
+        if self.sync_mode is SyncMode.ALWAYS and level.value >= LogLevel.ERROR.value:
+            self._sync()
+    
+    def _sync(self):
+        """fdatasync the log file if anything was written since the last sync"""
+        with self.buffer_lock:
+            if self._unsynced:
+                self._unsynced = False
+                _fdatasync(self._log_fp.fileno())
+    
+    def _log_task_batch(self):
+        """Log the task updates counted since the last batch as one entry"""
+        with self._task_counts_lock:
+            if not self._task_counts:
+                return
+            counts, self._task_counts = self._task_counts, Counter()
         
-        return False
+        summary = ", ".join(f"{n} {status}" for status, n in counts.items())
+        self.log(f"Task batch: {summary}", LogLevel.INFO, {"tasks": dict(counts)})
     
-    def _write_to_file(self, formatted_message: str):
-        """Write to log file"""
-        with open(self.log_file, 'a', encoding='utf-8') as f:
-            f.write(formatted_message)
+    def close(self):
+        """Stop the background writer, write out queued entries and close the log file"""
+        if self._log_fp.closed:
+            return
+        _OPEN_LOGGERS.discard(self)
+        
+        self._stop.set()
+        writer = self._writer_thread
+        if writer is not None:
+            writer.join(timeout=1)
+            self._writer_thread = None
+        
+        self._log_task_batch()
+        self._drain()
+        if self.sync_mode is not SyncMode.NEVER:
+            self._sync()
+        
+        # Final metrics snapshot for counters changed since the last tick
+        if self._append_only:
+            self._merge_metrics()
+        elif self._metrics_stale():
+            self._update_metrics({})
+        with self.buffer_lock:
+            self._log_fp.close()
     
     def _write_to_console(self, level: LogLevel, message: str, context: Dict = None):
         """Write to console with appropriate formatting"""
-        timestamp = datetime.now().strftime("%H:%M")
+        prefix = _CONSOLE_PREFIX.get(level)
+        if prefix is None:
+            prefix = f"[{self._time_str()[:5]}] "
         
-        if level == LogLevel.MILESTONE:
-            # Special milestone formatting
-            print(f"[{timestamp}] {message}")
-        elif level == LogLevel.CRITICAL:
-            print(f"🚨 CRITICAL: {message}")
-        elif level == LogLevel.ERROR:
-            print(f"❌ ERROR: {message}")
-        elif level == LogLevel.WARNING:
-            print(f"⚠️  WARNING: {message}")
-        else:
-            print(f"[{timestamp}] {message}")
+        # One write per line; errors are pushed out even when stdout is a pipe
+        sys.stdout.write(f"{prefix}{message}\n")
+        if level.value >= LogLevel.ERROR.value:
+            sys.stdout.flush()
         
-        self.last_console_update = datetime.now()
+        self.last_console_update = time.monotonic()
     
     def _handle_milestone_update(self, message: str, context: Dict = None):
         """Special handling for milestone updates"""
@@ -245,30 +428,82 @@ class TokenEfficientLogger:
                 "message": message,
                 **context
             })
+            if "completed" in context.get("status", ""):
+                self._milestones_completed += 1
+                self._metrics_dirty = True
     
     def _increment_metrics(self, level: LogLevel):
         """Update metrics counters"""
         if level == LogLevel.ERROR:
             self.error_count += 1
+            self._metrics_dirty = True
         elif level == LogLevel.WARNING:
             self.warning_count += 1
+            self._metrics_dirty = True
         elif level == LogLevel.MILESTONE:
             # Will be updated by milestone_update method
             pass
     
     def _update_metrics(self, metrics: Dict):
         """Update metrics file"""
+        # Clear first so a counter bumped mid-write marks the next tick dirty
+        self._metrics_dirty = False
+        self._metrics_minutes = self._get_session_duration_minutes()
         current_metrics = {
             "last_updated": datetime.now().isoformat(),
-            "session_duration_minutes": self._get_session_duration_minutes(),
+            "session_duration_minutes": self._metrics_minutes,
             "errors": self.error_count,
             "warnings": self.warning_count,
-            "milestones_completed": len([m for m in self.milestone_history if "completed" in m.get("status", "")]),
+            "milestones_completed": self._milestones_completed,
+            "session_start": self.session_start.isoformat(),
+            "mode": self.mode.value,
             **metrics
         }
         
-        with open(self.metrics_file, 'w') as f:
-            json.dump(current_metrics, f, indent=2)
+        self._write_metrics(current_metrics)
+    
+    def _merge_metrics(self):
+        """Add this one-shot logger's counts to the metrics file, creating it if missing"""
+        try:
+            with open(self.metrics_file) as f:
+                metrics = json.load(f)
+        except (OSError, ValueError):
+            metrics = None
+        
+        if not isinstance(metrics, dict):
+            self._update_metrics({
+                "total_logs": 0,
+                "console_updates": 0
+            })
+            return
+        
+        now = datetime.now()
+        metrics["last_updated"] = now.isoformat()
+        try:
+            started = datetime.fromisoformat(metrics["session_start"])
+            metrics["session_duration_minutes"] = int((now - started).total_seconds() / 60)
+        except (KeyError, TypeError, ValueError):
+            pass
+        
+        for key, count in (("errors", self.error_count),
+                           ("warnings", self.warning_count),
+                           ("milestones_completed", self._milestones_completed)):
+            previous = metrics.get(key)
+            metrics[key] = (previous if isinstance(previous, int) else 0) + count
+        
+        self._write_metrics(metrics)
+    
+    def _write_metrics(self, metrics: Dict):
+        """Write the metrics file"""
+        # Swap in a complete file so readers never see a partial write
+        tmp_path = self.metrics_file.with_name(self.metrics_file.name + ".tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(metrics, f, indent=2)
+        os.replace(tmp_path, self.metrics_file)
+    
+    def _metrics_stale(self) -> bool:
+        """Check whether any metrics field changed since the last write"""
+        return self._metrics_dirty or self._get_session_duration_minutes() != self._metrics_minutes
     
     def _get_session_duration_minutes(self) -> int:
         """Get session duration in minutes"""
@@ -278,17 +513,46 @@ class TokenEfficientLogger:
     def _start_status_updater(self):
         """Start background thread to update status file"""
         def update_loop():
-            while True:
+            try:
+                writer_loop()
+            finally:
+                # Loggers write through once the writer is gone, even if it died
+                self._writer_thread = None
+        
+        def writer_loop():
+            last_metrics = last_batch = last_sync = time.monotonic()
+            write_error_reported = False
+            # Drain queued log entries every 200 ms until close()
+            while not self._stop.wait(0.2):
                 try:
-                    # Update status file every 30 seconds
-                    time.sleep(30)
-                    # Status file will be updated by Technical Writer
-                    # This just ensures metrics are fresh
-                    self._update_metrics({})
-                except:
-                    break
+                    now = time.monotonic()
+                    
+                    # Roll up aggregated task updates every second
+                    if now - last_batch >= 1:
+                        self._log_task_batch()
+                        last_batch = now
+                    
+                    self._drain()
+                    
+                    if self.sync_mode is SyncMode.INTERVAL and now - last_sync >= self.sync_interval_sec:
+                        self._sync()
+                        last_sync = now
+                    
+                    # Update status file at most every 30 seconds
+                    if now - last_metrics >= 30:
+                        # Status file will be updated by Technical Writer
+                        # This just ensures metrics are fresh
+                        if self._metrics_stale():
+                            self._update_metrics({})
+                        last_metrics = now
+                except OSError as e:
+                    # Disk full or unavailable; unwritten entries stay queued for the next tick
+                    if not write_error_reported:
+                        write_error_reported = True
+                        sys.stderr.write(f"⚠️  IRIS logger: writing {self.log_file} failed ({e}); retrying\n")
         
         status_thread = threading.Thread(target=update_loop, daemon=True)
+        self._writer_thread = status_thread
         status_thread.start()
     
     def _emergency_stop(self, message: str, context: Dict = None):
@@ -307,11 +571,10 @@ Check {self.log_file} for full details.
 """
         print(emergency_msg)
         
-        # Write emergency details to file
+        # Write emergency details to file in one write
+        context_block = f"\nContext:\n```json\n{json.dumps(context, indent=2)}\n```" if context else ""
         with open(self.tasks_dir / "EMERGENCY_STOP.md", 'w') as f:
-            f.write(emergency_msg)
-            if context:
-                f.write(f"\nContext:\n```json\n{json.dumps(context, indent=2)}\n```")
+            f.write(emergency_msg + context_block)
     
     def get_session_summary(self) -> Dict:
         """Get summary of current session"""
@@ -321,15 +584,15 @@ Check {self.log_file} for full details.
             "mode": self.mode.value,
             "errors": self.error_count,
             "warnings": self.warning_count,
-            "milestones_completed": len(self.milestone_history),
+            "milestones_completed": self._milestones_completed,
             "log_file": str(self.log_file),
             "status_file": str(self.status_file)
         }
 
 # Convenience functions for easy import
-def create_silent_logger(project_root: str = None) -> TokenEfficientLogger:
+def create_silent_logger(project_root: str = None, aggregate_tasks: bool = False) -> TokenEfficientLogger:
     """Create logger optimized for autopilot mode"""
-    return TokenEfficientLogger(OutputMode.SILENT, project_root)
+    return TokenEfficientLogger(OutputMode.SILENT, project_root, aggregate_tasks)
 
 def create_verbose_logger(project_root: str = None) -> TokenEfficientLogger:
     """Create logger for debugging/learning mode"""
@@ -339,15 +602,12 @@ def create_emergency_logger(project_root: str = None) -> TokenEfficientLogger:
     """Create logger that only shows critical errors"""
     return TokenEfficientLogger(OutputMode.EMERGENCY, project_root)
 
-def main():
-    """CLI entry point for token_efficient_logger"""
-    import argparse
-
-    parser = argparse.ArgumentParser(
-        description='IRIS Token Efficient Logger CLI',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog='''
+_CLI_EPILOG = '''
 Commands:
+  session_start
+      Start a new autopilot session: write a session header to the log
+      and reset the session counters in autopilot_metrics.json
+
   milestone_update <id> <status> <complete> <total> [duration]
       Log a milestone status update
 
@@ -372,12 +632,105 @@ Options:
   --project-root DIR  Set project root directory
 
 Examples:
+  python3 token_efficient_logger.py session_start
   python3 token_efficient_logger.py milestone_update M1 completed 5 5 15
   python3 token_efficient_logger.py task_update T-AUTH-1 completed 3
   python3 token_efficient_logger.py info "Task started"
   python3 token_efficient_logger.py error "Something failed" --recoverable
   python3 token_efficient_logger.py -c "logger.info('Custom log')"
 '''
+
+
+def _cmd_session_start(logger: TokenEfficientLogger, args):
+    # The logger was created as a session logger, which wrote the header and reset the metrics
+    print(f"Started logging session: {logger.session_start.isoformat()}")
+
+def _cmd_milestone_update(logger: TokenEfficientLogger, args):
+    cmd_args = args.args
+    if len(cmd_args) < 4:
+        print("Error: milestone_update requires: <id> <status> <tasks_complete> <total_tasks> [duration]")
+        sys.exit(1)
+
+    milestone_id = cmd_args[0]
+    status = cmd_args[1]
+    tasks_complete = int(cmd_args[2])
+    total_tasks = int(cmd_args[3])
+    duration = int(cmd_args[4]) if len(cmd_args) > 4 else None
+
+    logger.milestone_update(milestone_id, status, tasks_complete, total_tasks, duration)
+    print(f"Logged milestone update: {milestone_id} -> {status}")
+
+def _cmd_task_update(logger: TokenEfficientLogger, args):
+    cmd_args = args.args
+    if len(cmd_args) < 2:
+        print("Error: task_update requires: <id> <status> [duration]")
+        sys.exit(1)
+
+    task_id = cmd_args[0]
+    status = cmd_args[1]
+    duration = int(cmd_args[2]) if len(cmd_args) > 2 else None
+
+    logger.task_update(task_id, status, duration)
+    print(f"Logged task update: {task_id} -> {status}")
+
+def _cmd_info(logger: TokenEfficientLogger, args):
+    message = ' '.join(args.args) if args.args else 'Info message'
+    logger.info(message)
+    print(f"Logged info: {message}")
+
+def _cmd_warning(logger: TokenEfficientLogger, args):
+    message = ' '.join(args.args) if args.args else 'Warning message'
+    logger.warning(message)
+    print(f"Logged warning: {message}")
+
+def _cmd_error(logger: TokenEfficientLogger, args):
+    message = ' '.join(args.args) if args.args else 'Error message'
+    logger.error(message, recoverable=args.recoverable)
+    print(f"Logged error: {message}")
+
+def _cmd_debug(logger: TokenEfficientLogger, args):
+    message = ' '.join(args.args) if args.args else 'Debug message'
+    logger.debug(message)
+    print(f"Logged debug: {message}")
+
+def _cmd_summary(logger: TokenEfficientLogger, args):
+    summary = logger.get_session_summary()
+    print(json.dumps(summary, indent=2))
+
+def _cmd_test(logger: TokenEfficientLogger, args):
+    # Run test sequence
+    print(f"Testing IRIS Logger in {logger.mode.value} mode...")
+
+    logger.info("Starting test sequence")
+    logger.debug("This is a debug message")
+    logger.warning("This is a warning")
+    logger.milestone_update("1", "in_progress", 2, 5)
+    logger.task_update("T1-001", "completed", 3)
+    logger.milestone_update("1", "completed", 5, 5, 15)
+    logger.info("Test sequence complete")
+
+    print(f"Session summary: {logger.get_session_summary()}")
+    print(f"Log file: {logger.log_file}")
+    print(f"Status file: {logger.status_file}")
+
+_CLI_COMMANDS = {
+    'session_start': _cmd_session_start,
+    'milestone_update': _cmd_milestone_update,
+    'task_update': _cmd_task_update,
+    'info': _cmd_info,
+    'warning': _cmd_warning,
+    'error': _cmd_error,
+    'debug': _cmd_debug,
+    'summary': _cmd_summary,
+    'test': _cmd_test,
+}
+
+def main():
+    """CLI entry point for token_efficient_logger"""
+    parser = argparse.ArgumentParser(
+        description='IRIS Token Efficient Logger CLI',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_CLI_EPILOG
     )
 
     parser.add_argument('command', nargs='?', help='Command to execute')
@@ -392,95 +745,34 @@ Examples:
     # Determine output mode
     mode = OutputMode.VERBOSE if args.verbose else OutputMode.SILENT
 
-    # Create logger
-    logger = TokenEfficientLogger(mode, args.project_root)
-
-    # Handle -c option for arbitrary code execution
-    if args.code:
-        # Execute code with logger in scope
-        exec(args.code, {'logger': logger, 'LogLevel': LogLevel})
-        return
-
-    # Handle commands
-    if not args.command:
-        parser.print_help()
-        return
-
-    command = args.command.lower()
-    cmd_args = args.args
-
-    if command == 'milestone_update':
-        if len(cmd_args) < 4:
-            print("Error: milestone_update requires: <id> <status> <tasks_complete> <total_tasks> [duration]")
+    # Create logger; each CLI call appends to the running session's log,
+    # except session_start, which begins a new session
+    starts_session = not args.code and (args.command or '').lower() == 'session_start'
+    logger = TokenEfficientLogger(mode, args.project_root, append_only=not starts_session)
+
+    try:
+        # Handle -c option for arbitrary code execution
+        if args.code:
+            # Execute code with logger in scope
+            exec(args.code, {'logger': logger, 'LogLevel': LogLevel})
+            return
+
+        # Handle commands
+        if not args.command:
+            parser.print_help()
+            return
+
+        command = args.command.lower()
+        handler = _CLI_COMMANDS.get(command)
+        if handler is None:
+            print(f"Unknown command: {command}")
+            parser.print_help()
             sys.exit(1)
 
-        milestone_id = cmd_args[0]
-        status = cmd_args[1]
-        tasks_complete = int(cmd_args[2])
-        total_tasks = int(cmd_args[3])
-        duration = int(cmd_args[4]) if len(cmd_args) > 4 else None
-
-        logger.milestone_update(milestone_id, status, tasks_complete, total_tasks, duration)
-        print(f"Logged milestone update: {milestone_id} -> {status}")
-
-    elif command == 'task_update':
-        if len(cmd_args) < 2:
-            print("Error: task_update requires: <id> <status> [duration]")
-            sys.exit(1)
-
-        task_id = cmd_args[0]
-        status = cmd_args[1]
-        duration = int(cmd_args[2]) if len(cmd_args) > 2 else None
-
-        logger.task_update(task_id, status, duration)
-        print(f"Logged task update: {task_id} -> {status}")
-
-    elif command == 'info':
-        message = ' '.join(cmd_args) if cmd_args else 'Info message'
-        logger.info(message)
-        print(f"Logged info: {message}")
-
-    elif command == 'warning':
-        message = ' '.join(cmd_args) if cmd_args else 'Warning message'
-        logger.warning(message)
-        print(f"Logged warning: {message}")
-
-    elif command == 'error':
-        message = ' '.join(cmd_args) if cmd_args else 'Error message'
-        logger.error(message, recoverable=args.recoverable)
-        print(f"Logged error: {message}")
-
-    elif command == 'debug':
-        message = ' '.join(cmd_args) if cmd_args else 'Debug message'
-        logger.debug(message)
-        print(f"Logged debug: {message}")
-
-    elif command == 'summary':
-        summary = logger.get_session_summary()
-        print(json.dumps(summary, indent=2))
-
-    elif command == 'test':
-        # Run test sequence
-        print(f"Testing IRIS Logger in {mode.value} mode...")
-
-        logger.info("Starting test sequence")
-        logger.debug("This is a debug message")
-        logger.warning("This is a warning")
-        logger.milestone_update("1", "in_progress", 2, 5)
-        logger.task_update("T1-001", "completed", 3)
-        logger.milestone_update("1", "completed", 5, 5, 15)
-        logger.info("Test sequence complete")
-
-        print(f"Session summary: {logger.get_session_summary()}")
-        print(f"Log file: {logger.log_file}")
-        print(f"Status file: {logger.status_file}")
-
-    else:
-        print(f"Unknown command: {command}")
-        parser.print_help()
-        sys.exit(1)
+        handler(logger, args)
+    finally:
+        logger.close()
 
 
 if __name__ == "__main__":
-    import sys
     main()
\ No newline at end of file